@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 import piqmc.sa as sa
 import piqmc.qmc as qmc
 import copy
@@ -0,0 +1,292 @@
+"""Command line interface for SA and PIQMC annealing experiments.
+
+Model, algorithm and annealing parameters are read from an optional JSON or YAML
+config file and can be overridden with flags, e.g.
+
+    python run.py --model EA --algorithm PIQMC --seed 3 --tau_schedule 2 4 8
+    python run.py --config experiment.json --P 40 --dry_run
+
+numpy, the models and the Cython extensions are only imported once an experiment
+is actually run, so that --dry_run and --help return immediately.
+"""
+import argparse
+import json
+import os
+
+MODELS = ["EA", "SK", "Wishart"]
+ALGORITHMS = ["SA", "PIQMC"]
+
+# Parameters that can be set in a config file or on the command line, with their types.
+# These are passed on to the annealer classes in python_interface.py.
+ANNEALER_PARAMS = {
+    "SA": {
+        "tau_schedule": [int],
+        "mcsteps": int,
+        "T_0": float,
+        "T_f": float,
+        "num_warmup": int,
+    },
+    "PIQMC": {
+        "tau_schedule": [int],
+        "mcsteps": int,
+        "gamma_0": float,
+        "gamma_T": float,
+        "P": int,
+        "PT": float,
+        "preannealing_temperature": float,
+        "preannealing_schedule_steps": int,
+        "preannealing_mcsteps": int,
+    },
+}
+# Parameters describing the model instance and the experiment.
+EXPERIMENT_PARAMS = {
+    "model": str,
+    "algorithm": str,
+    "seed": int,
+    "numruns": int,
+    "nrows": int,
+    "ncols": int,
+    "N": int,
+    "alpha": float,
+    "datadir": str,
+    "resultsdir": str,
+}
+
+# Defaults of the former run_<ALGORITHM>_<MODEL>.py scripts.
+DEFAULTS = {
+    ("EA", "SA"): dict(nrows=40, ncols=40, numruns=25, tau_schedule=[2 ** i for i in range(1, 13 + 1)],
+                       mcsteps=5, num_warmup=2000),
+    ("EA", "PIQMC"): dict(nrows=40, ncols=40, numruns=25, tau_schedule=[2 ** i for i in range(1, 13 + 1)],
+                          mcsteps=5, P=20),
+    ("SK", "SA"): dict(N=100, numruns=50, tau_schedule=[2 ** i for i in range(1, 14 + 1)],
+                       mcsteps=5, T_0=2.0, num_warmup=2000),
+    ("SK", "PIQMC"): dict(N=100, numruns=50, tau_schedule=[2 ** i for i in range(1, 14 + 1)],
+                          mcsteps=5, P=100, gamma_0=2.0),
+    ("Wishart", "SA"): dict(N=32, alpha=0.5, numruns=50, tau_schedule=[2 ** i for i in range(1, 16 + 1)],
+                            mcsteps=5, num_warmup=1000),
+    ("Wishart", "PIQMC"): dict(N=32, alpha=0.5, numruns=50, tau_schedule=[2 ** i for i in range(1, 14 + 1)],
+                               mcsteps=5, P=100),
+}
+COMMON_DEFAULTS = dict(seed=1, datadir="./data", resultsdir="./results")
+
+# Defaults of the annealer classes, only needed for the dry-run cost estimate.
+ANNEALER_DEFAULTS = {
+    "SA": dict(num_warmup=1000),
+    "PIQMC": dict(P=20, preannealing_schedule_steps=60, preannealing_mcsteps=100),
+}
+
+
+def all_params():
+    params = dict(EXPERIMENT_PARAMS)
+    for algorithm_params in ANNEALER_PARAMS.values():
+        params.update(algorithm_params)
+    return params
+
+
+def convert(name, value, ptype):
+    """Cast a config value to the type of parameter @name, raising ValueError if that is not possible."""
+    if isinstance(ptype, list):
+        if not isinstance(value, (list, tuple)):
+            raise ValueError("Parameter {} must be a list, got {!r}".format(name, value))
+        return [convert(name, v, ptype[0]) for v in value]
+    if isinstance(value, bool) or isinstance(value, (list, tuple, dict)):
+        raise ValueError("Parameter {} must be of type {}, got {!r}".format(name, ptype.__name__, value))
+    if ptype is int and isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError("Parameter {} must be an integer, got {!r}".format(name, value))
+        return int(value)
+    try:
+        return ptype(value)
+    except (TypeError, ValueError):
+        raise ValueError("Parameter {} must be of type {}, got {!r}".format(name, ptype.__name__, value))
+
+
+def load_config(fname):
+    """Read a flat JSON or YAML config file into a dictionary of typed parameters."""
+    with open(fname) as f:
+        if fname.endswith((".yml", ".yaml")):
+            import yaml
+            config = yaml.safe_load(f) or {}
+        else:
+            config = json.load(f)
+    if not isinstance(config, dict):
+        raise ValueError("Config file {} must contain a mapping of parameters".format(fname))
+    params = all_params()
+    unknown = sorted(set(config) - set(params))
+    if unknown:
+        raise ValueError("Unknown parameters in {}: {}".format(fname, ", ".join(unknown)))
+    return {name: convert(name, value, params[name]) for name, value in config.items()}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--config', default=None, help="JSON or YAML file with experiment parameters")
+    parser.add_argument('--dry_run', action='store_true',
+                        help="Print the configuration and the number of spin-flip attempts, without annealing")
+    # All parameters default to None so that only explicitly passed flags override the config file.
+    for name, ptype in all_params().items():
+        if isinstance(ptype, list):
+            parser.add_argument('--' + name, type=ptype[0], nargs='+', default=None)
+        elif name == "model":
+            parser.add_argument('--model', choices=MODELS, default=None)
+        elif name == "algorithm":
+            parser.add_argument('--algorithm', choices=ALGORITHMS, default=None)
+        else:
+            parser.add_argument('--' + name, type=ptype, default=None)
+    return parser
+
+
+def resolve_config(args):
+    """Merge defaults, the config file and command line flags, in increasing order of precedence."""
+    config = load_config(args.config) if args.config is not None else {}
+    flags = {name: value for name, value in vars(args).items()
+             if value is not None and name not in ("config", "dry_run")}
+    config.update(flags)
+
+    model = config.get("model")
+    algorithm = config.get("algorithm")
+    if model not in MODELS:
+        raise ValueError("model must be one of {}, got {!r}".format(MODELS, model))
+    if algorithm not in ALGORITHMS:
+        raise ValueError("algorithm must be one of {}, got {!r}".format(ALGORITHMS, algorithm))
+
+    unused = sorted(name for name in config
+                    if name not in EXPERIMENT_PARAMS and name not in ANNEALER_PARAMS[algorithm])
+    if unused:
+        raise ValueError("Parameters {} are not used by {}".format(", ".join(unused), algorithm))
+
+    resolved = dict(COMMON_DEFAULTS)
+    resolved.update(DEFAULTS[(model, algorithm)])
+    resolved.update(config)
+    return resolved
+
+
+def annealer_kwargs(config):
+    return {name: config[name] for name in ANNEALER_PARAMS[config["algorithm"]] if name in config}
+
+
+def nspins(config):
+    if config["model"] == "EA":
+        return config["nrows"] * config["ncols"]
+    return config["N"]
+
+
+def spin_flip_attempts(config):
+    """Number of single spin-flip attempts of one annealing run over the full tau schedule.
+
+    A PIQMC sweep attempts a flip of every spin in each Trotter slice, followed by a global move
+    that attempts to flip every spin in all slices at once.
+    """
+    params = dict(ANNEALER_DEFAULTS[config["algorithm"]])
+    params.update(config)
+    n = nspins(config)
+    total_tau = sum(params["tau_schedule"])
+    if config["algorithm"] == "SA":
+        # Every schedule starts from a fresh configuration that is warmed up at T_0
+        warmup = params["num_warmup"] * n * len(params["tau_schedule"])
+        return warmup + total_tau * params["mcsteps"] * n
+    # Pre-annealing is done once per run, with a single classical replica
+    preannealing = params["preannealing_schedule_steps"] * params["preannealing_mcsteps"] * n
+    return preannealing + total_tau * params["mcsteps"] * (params["P"] + 1) * n
+
+
+def result_paths(config):
+    """Return the results directory and checkpoint file of the experiment."""
+    model, algorithm = config["model"], config["algorithm"]
+    realization = config["seed"]
+    resultsdir = os.path.join(config["resultsdir"], model, algorithm)
+    if model == "EA":
+        name = 'EA_' + str(config["nrows"]) + 'x' + str(config["ncols"])
+        if algorithm == "PIQMC":
+            name += '_P' + str(config["P"])
+    elif model == "SK":
+        name = 'SK_N' + str(config["N"])
+    else:
+        name = 'Wishart_N' + str(config["N"]) + '_alpha' + str(config["alpha"])
+    name += '_' + algorithm + '_realization' + str(realization)
+    if algorithm == "SA":
+        name += '_numwarmup' + str(config.get("num_warmup", ANNEALER_DEFAULTS["SA"]["num_warmup"]))
+    return resultsdir, os.path.join(resultsdir, name + '_Energies.npy')
+
+
+def load_model(config):
+    model, datadir, realization = config["model"], config["datadir"], config["seed"]
+    if model == "EA":
+        from models import EdwardsAnderson
+        nrows, ncols = config["nrows"], config["ncols"]
+        instancedir = os.path.join(datadir, 'EA_' + str(nrows) + 'x' + str(ncols))
+        gs_fname = os.path.join(instancedir, 'gs_seed' + str(realization) + '.txt')
+        interactions_fname = os.path.join(instancedir, str(nrows) + 'x' + str(ncols) + '_uniform_seed'
+                                          + str(realization) + '.txt')
+        return EdwardsAnderson(nrows=nrows, ncols=ncols, gs_fname=gs_fname, interactions_fname=interactions_fname)
+    elif model == "SK":
+        from models import SK
+        N = config["N"]
+        interactions_fname = os.path.join(datadir, 'SK_N' + str(N), str(N) + '_SK_seed' + str(realization) + '.txt')
+        return SK(nspins=N, interactions_fname=interactions_fname)
+    else:
+        import numpy as np
+        from models import Wishart
+        N, alpha = config["N"], config["alpha"]
+        interactions_fname = os.path.join(datadir, 'wishart_N' + str(N), 'wpe_size' + str(N) + '_alpha' + str(alpha)
+                                          + '_realization' + str(realization) + '.txt')
+        return Wishart(nspins=N, interactions=np.loadtxt(interactions_fname))
+
+
+def run(config):
+    import numpy as np
+    from python_interface import ClassicalAnneal, QuantumPIAnneal
+
+    resultsdir, checkpointfile = result_paths(config)
+    os.makedirs(resultsdir, exist_ok=True)
+
+    model = load_model(config)
+    latticetype = "2D" if config["model"] == "EA" else "FullyConnected"
+    kwargs = annealer_kwargs(config)
+    numruns = config["numruns"]
+
+    if config["algorithm"] == "SA":
+        annealer = ClassicalAnneal
+        Energies = np.zeros((numruns, len(config["tau_schedule"])), np.float64)
+    else:
+        annealer = QuantumPIAnneal
+        Energies = np.zeros((numruns, len(config["tau_schedule"]), config["P"]), np.float64)
+
+    try:
+        print("Loading checkpoint!")
+        Loaded = np.load(checkpointfile)
+        Energies[:Loaded.shape[0]] = Loaded
+    except (OSError, ValueError):
+        print("Failed! Running from scratch")
+        Loaded = []
+
+    for annealingrun in range(len(Loaded) + 1, numruns + 1):
+        print("Annealing run number ", annealingrun)
+        # The annealers pop their parameters from kwargs, so pass a copy
+        A = annealer(model, latticetype=latticetype, annealingrunseed=annealingrun, **dict(kwargs))
+        Energies[annealingrun - 1] = A.perform_tau_schedule()
+        np.save(checkpointfile, Energies[:annealingrun])
+
+
+def dry_run(config):
+    _, checkpointfile = result_paths(config)
+    attempts = spin_flip_attempts(config)
+    for name in sorted(config):
+        print("{} = {}".format(name, config[name]))
+    print("checkpoint file =", checkpointfile)
+    print("spin-flip attempts per annealing run = {}".format(attempts))
+    print("total spin-flip attempts = {}".format(attempts * config["numruns"]))
+
+
+if __name__ == "__main__":
+    parser = build_parser()
+    args = parser.parse_args()
+    try:
+        config = resolve_config(args)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    if args.dry_run:
+        dry_run(config)
+    else:
+        run(config)